@@ -1,11 +1,84 @@
 import os
 import random
+from io import BytesIO
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 import cv2
 import numpy as np
 from PIL import Image
 from docx import Document
 from docx.shared import Inches, Cm
 
+# --- GROUPS ---
+# char -> (height as a fraction of the safe zone, vertical placement)
+#   'baseline' : bottom of the glyph sits on the baseline
+#   'high'     : quote marks float near the top of the box
+#   'x_height' : descenders start at the top of the short letters
+CHAR_CLASS = {
+    **{c: (0.20, 'baseline') for c in '.,-'},
+    **{c: (0.20, 'high') for c in '\'"`'},
+    **{c: (0.65, 'baseline') for c in 'ftbdhkl'},   # Max 65% (approx 32px)
+    **{c: (0.65, 'x_height') for c in 'gjpqy'},
+    # Added 's' to short letters to fix the specific clipping you saw
+    **{c: (0.35, 'baseline') for c in 'aceimnorsuvwxz'},  # Small letters are tiny (~18px)
+}
+
+# --- MAPPING ---
+# Characters that can't be used as folder names
+SPECIAL_CHAR_MAP = {
+    '.': 'dot', '"': 'quote', ':': 'colon', '?': 'question',
+    '*': 'asterisk', '/': 'slash', '\\': 'backslash',
+    '<': 'lt', '>': 'gt', '|': 'pipe', ',': 'comma', "'": 'apostrophe'
+}
+FOLDER_CHAR_MAP = {folder: char for char, folder in SPECIAL_CHAR_MAP.items()}
+
+# Numba is optional: with it the glyph blend runs as one compiled loop,
+# without it we fall back to plain NumPy.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _blend_glyph(canvas, alpha, y0, x0, ink0, ink1, ink2):
+    h, w = alpha.shape
+    for i in range(h):
+        for j in range(w):
+            a = alpha[i, j]
+            if a:
+                y = y0 + i
+                x = x0 + j
+                inv = 255 - a
+                canvas[y, x, 0] = (ink0 * a + canvas[y, x, 0] * inv) // 255
+                canvas[y, x, 1] = (ink1 * a + canvas[y, x, 1] * inv) // 255
+                canvas[y, x, 2] = (ink2 * a + canvas[y, x, 2] * inv) // 255
+
+# Runs serially in the main process: generate() blends each full-width
+# paragraph block onto the page with it, and only pixels with ink do any work
+_blend_glyph = njit(cache=True)(_blend_glyph) if njit else None
+
+
+def _place_glyph(resized, std_size, start_y):
+    new_h, new_w = resized.shape
+
+    # Strict Clamp (Just in case, but the baseline math prevents it)
+    if start_y < 0: start_y = 0
+    if start_y + new_h > std_size: start_y = std_size - new_h
+
+    norm_canvas = np.zeros((std_size, new_w), dtype=np.uint8)
+    norm_canvas[start_y:start_y+new_h, 0:new_w] = resized
+    return norm_canvas
+
+# Each worker process gets its own copy of the engine (baked glyphs included)
+_worker_engine = None
+
+def _init_worker(engine):
+    global _worker_engine
+    _worker_engine = engine
+
+def _render_paragraph_in_worker(line, seed):
+    return _worker_engine._render_paragraph(line, seed)
+
 class NormalizedHandwritingEngine:
     def __init__(self, base_path="my_letters", ink_color=(20, 24, 82)):
         self.base_path = base_path
@@ -14,21 +87,48 @@ class NormalizedHandwritingEngine:
         self.line_height = 65    
         self.char_spacing = 2    
 
+        self._dilate_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+
+        self._ink = np.array(ink_color, dtype=np.uint16)
+
+        # Compile the blend kernel now so the first page doesn't pay for it
+        if _blend_glyph is not None:
+            _blend_glyph(np.full((1, 1, 3), 255, np.uint8), np.zeros((1, 1), np.uint8), 0, 0, *self.ink_color)
+
+        # Process the whole letter library up front so generate() never
+        # touches OpenCV: folder name -> list of ready-made alpha masks
+        self.preload()
+
+    def preload(self):
+        # Call again if the letters folder changes
+        self._baked = defaultdict(list)
+        for folder_name, paths in self._scan_variants().items():
+            char = FOLDER_CHAR_MAP.get(folder_name, folder_name)
+            for path in paths:
+                alpha = self.process_letter_contour(path, char)
+                if alpha is not None:
+                    self._baked[folder_name].append(alpha)
+
     def process_letter_contour(self, image_path, char_ref):
-        img = cv2.imread(image_path)
-        if img is None: return None
+        # Decode straight to greyscale - no 3-channel buffer needed
+        gray = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+        if gray is None: return None
         
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
         _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
         
-        contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        if not contours: return None
+        # One C pass gives every ink blob's area and bounding box
+        n_labels, _, stats, _ = cv2.connectedComponentsWithStats(thresh, connectivity=8)
+        if n_labels < 2: return None
         
-        valid_contours = [cnt for cnt in contours if cv2.contourArea(cnt) > 10]
-        if not valid_contours: valid_contours = contours
+        blobs = stats[1:]  # row 0 is the background
+        # Ignore tiny specks of noise from the photo
+        valid_blobs = blobs[blobs[:, cv2.CC_STAT_AREA] > 10]
+        if len(valid_blobs) == 0: valid_blobs = blobs
 
-        all_points = np.concatenate(valid_contours)
-        x, y, w, h = cv2.boundingRect(all_points)
+        x = valid_blobs[:, cv2.CC_STAT_LEFT].min()
+        y = valid_blobs[:, cv2.CC_STAT_TOP].min()
+        w = (valid_blobs[:, cv2.CC_STAT_LEFT] + valid_blobs[:, cv2.CC_STAT_WIDTH]).max() - x
+        h = (valid_blobs[:, cv2.CC_STAT_TOP] + valid_blobs[:, cv2.CC_STAT_HEIGHT]).max() - y
         letter_roi = thresh[y:y+h, x:x+w]
         
         # --- FIX 1: HEAVY PRE-PADDING ---
@@ -36,22 +136,12 @@ class NormalizedHandwritingEngine:
         # This guarantees that even if we resize or dilate later, 
         # the ink is far from the image edge.
         roi_padding = 10
-        letter_roi = cv2.copyMakeBorder(
-            letter_roi, 
-            roi_padding, roi_padding, roi_padding, roi_padding, 
-            cv2.BORDER_CONSTANT, 
-            value=0
-        )
+        padded = np.zeros((h + 2 * roi_padding, w + 2 * roi_padding), dtype=np.uint8)
+        padded[roi_padding:roi_padding+h, roi_padding:roi_padding+w] = letter_roi
+        letter_roi = padded
         # Update dimensions after padding
         h, w = letter_roi.shape 
         
-        # --- GROUPS ---
-        small_punct = ['.', ',', "'", '"', '`', '-']
-        tall_letters = ['f', 't', 'b', 'd', 'h', 'k', 'l']
-        descenders = ['g', 'j', 'p', 'q', 'y']
-        # Added 's' to short letters to fix the specific clipping you saw
-        short_letters = ['a', 'c', 'e', 'i', 'm', 'n', 'o', 'r', 's', 'u', 'v', 'w', 'x', 'z']
-        
         char_type = char_ref.lower() 
         
         # --- FIX 2: DRASTIC SIZE REDUCTION ---
@@ -61,35 +151,30 @@ class NormalizedHandwritingEngine:
         # The "Safe Height" is the box size minus margins
         safe_zone = self.std_size - 4 
 
-        if char_type in small_punct:
-            target_height = int(safe_zone * 0.20)
-        elif char_type in tall_letters:
-            target_height = int(safe_zone * 0.65) # Max 65% (approx 32px)
-        elif char_type in descenders:
-            target_height = int(safe_zone * 0.65) # Max 65% (approx 32px)
-        elif char_type in short_letters:
-            target_height = int(safe_zone * 0.35) # Small letters are tiny (~18px)
-        else:
-            target_height = int(safe_zone * 0.60)
+        # One dict lookup instead of scanning each group list
+        height_frac, placement = CHAR_CLASS.get(char_type, (0.60, 'baseline'))
+        target_height = int(safe_zone * height_frac)
             
         aspect = w / h
         new_h = target_height
-        new_w = int(new_h * aspect)
+        # Hairline strokes (e.g. a thin 'l') would round down to 0 px wide,
+        # which cv2.resize rejects - keep them at least 1 px
+        new_w = max(1, int(new_h * aspect))
+        # INTER_AREA leaves soft grey edges - we keep them as anti-aliasing.
+        # Don't swap it for INTER_NEAREST/LINEAR: photos get shrunk ~20x here
+        # and those only sample a pixel or two, so thin strokes break up.
+        # This only runs once per library image (see preload) anyway.
         resized = cv2.resize(letter_roi, (new_w, new_h), interpolation=cv2.INTER_AREA)
         
         # --- POSITIONING ---
-        norm_canvas = np.zeros((self.std_size, new_w), dtype=np.uint8)
-        
         # FIX 3: LOWER BASELINE
         # We set the "floor" for letters like 'a' and 'b' at 70% down the box.
         # This leaves 30% of space at the bottom for descenders to hang into.
         baseline_y = int(self.std_size * 0.70) 
         
-        if char_type in ['.', ',']:
-            start_y = baseline_y - new_h
-        elif char_type in ["'", '"', '`']:
+        if placement == 'high':
             start_y = int(self.std_size * 0.15)
-        elif char_type in descenders:
+        elif placement == 'x_height':
             # Logic: Top of 'y' should match Top of 'a'.
             # 'a' sits at baseline and is 0.35 tall.
             # So top of 'a' is: baseline - (safe_zone * 0.35)
@@ -100,110 +185,185 @@ class NormalizedHandwritingEngine:
             # Note: Since 'y' is 0.65 tall, it will hang down to:
             # x_height_top + 0.65. This will fit perfectly in the remaining space.
         else:
-            # Tall letters and Short letters sit on the baseline
+            # Tall letters, Short letters and '.' ',' sit on the baseline
             start_y = baseline_y - new_h
 
-        # Strict Clamp (Just in case, but math above prevents it)
-        if start_y < 0: start_y = 0
-        if start_y + new_h > self.std_size: start_y = self.std_size - new_h
-
-        norm_canvas[start_y:start_y+new_h, 0:new_w] = resized
+        norm_canvas = _place_glyph(resized, self.std_size, start_y)
 
         # --- INK FLOW SIMULATION ---
-        kernel = np.ones((2, 2), np.uint8) 
-        norm_canvas = cv2.dilate(norm_canvas, kernel, iterations=2) 
-        _, norm_canvas = cv2.threshold(norm_canvas, 127, 255, cv2.THRESH_BINARY)
+        # Dilation (a max filter) thickens the strokes and keeps the grey edges.
+        # One pass with a 3x3 kernel == two passes with a 2x2 kernel.
+        # Anchor (2, 2) keeps the ink exactly where the old double pass put it.
+        norm_canvas = cv2.dilate(norm_canvas, self._dilate_kernel, anchor=(2, 2), iterations=1)
 
-        rgba = np.zeros((self.std_size, new_w, 4), dtype=np.uint8)
-        rgba[:, :, 0:3] = self.ink_color
-        rgba[:, :, 3] = norm_canvas
-        
-        return Image.fromarray(rgba)
+        # The glyph is just its (greyscale) alpha mask; ink colour is applied when drawing
+        return norm_canvas
 
-    def generate(self, text, output_file="normalized_notes.png"):
-        # 1. Create the Image Canvas
-        canvas = Image.new('RGBA', (2480, 3508), (255, 255, 255, 255))
-        
-        # --- MAPPING & SETTINGS ---
-        SPECIAL_CHAR_MAP = {
-            '.': 'dot', '"': 'quote', ':': 'colon', '?': 'question',
-            '*': 'asterisk', '/': 'slash', '\\': 'backslash',
-            '<': 'lt', '>': 'gt', '|': 'pipe', ',': 'comma', "'": 'apostrophe'
-        }
-        
+    def _composite(self, canvas, alpha, x, y):
+        # Clip to the page - long texts can run past the bottom edge
+        page_h, page_w = canvas.shape[:2]
+        h = min(alpha.shape[0], page_h - y)
+        w = min(alpha.shape[1], page_w - x)
+        if h <= 0 or w <= 0:
+            return
+
+        if _blend_glyph is not None:
+            _blend_glyph(canvas, alpha[:h, :w], y, x, *self.ink_color)
+            return
+
+        roi = canvas[y:y+h, x:x+w]
+        a = alpha[:h, :w, None].astype(np.uint16)
+        roi[:] = (self._ink * a + roi * (255 - a)) // 255
+
+    def _scan_variants(self):
+        # Maps folder name -> list of full image paths for that character
+        variants = {}
+        if not os.path.isdir(self.base_path):
+            return variants
+        for name in os.listdir(self.base_path):
+            char_dir = os.path.join(self.base_path, name)
+            if not os.path.isdir(char_dir):
+                continue
+            variants[name] = [
+                os.path.join(char_dir, f) for f in os.listdir(char_dir)
+                if f.lower().endswith(('.png', '.jpg', '.jpeg'))
+            ]
+        return variants
+
+    def _render_paragraph(self, line, seed):
+        # Renders one line of the input text (a paragraph) as a full-width
+        # alpha (ink coverage) block. Wrapped rows are stacked line_height apart.
+        # Page geometry never changes, so pull it into locals - the loops
+        # below run per character and local lookups are much cheaper
+        std_size = self.std_size
+        line_height = self.line_height
+        char_spacing = self.char_spacing
+        # Own RNG per paragraph (seeded by generate) so the letter variants
+        # picked don't depend on which process rendered the paragraph
+        choice = random.Random(seed).choice
         start_x = 200
         max_x = 2200
-        curr_x, curr_y = start_x, 200
-        pixels_per_space = int(self.std_size * 0.4)
+        curr_x, curr_row = start_x, 0
+        pixels_per_space = int(std_size * 0.4)
         
         # WIDTH FOR MISSING CHARACTERS
         # If a letter is missing, we leave a gap of this size (e.g., 25 pixels)
-        fallback_width = int(self.std_size * 0.5)
+        fallback_width = int(std_size * 0.5)
 
-        lines = text.split('\n')
+        # (row, x, word_items) for every word; drawn once we know how many rows we need
+        placed_words = []
 
-        # --- DRAWING LOOP ---
-        for line in lines:
-            words = line.split(' ')
-            
-            for word in words:
-                # We store tuples: (ImageObject, Width)
-                # If image is missing, we store (None, fallback_width)
-                word_items = [] 
-                word_total_width = 0
-                
-                for char in word:
-                    folder_name = SPECIAL_CHAR_MAP.get(char, char.lower())
-                    char_dir = os.path.join(self.base_path, folder_name)
-                    
-                    found_image = False
-                    
-                    if os.path.isdir(char_dir):
-                        variants = [f for f in os.listdir(char_dir) if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
-                        if variants:
-                            img = self.process_letter_contour(
-                                os.path.join(char_dir, random.choice(variants)), 
-                                char
-                            )
-                            if img:
-                                # SUCCESS: Add the letter image
-                                width = img.width + self.char_spacing
-                                word_items.append((img, width))
-                                word_total_width += width
-                                found_image = True
-                    
-                    # FAILURE: If folder missing, empty, or processing failed
-                    if not found_image:
-                        # Add a BLANK placeholder
-                        # print(f"Missing: {char}") # Uncomment to debug
-                        word_items.append((None, fallback_width))
-                        word_total_width += fallback_width
-
-                # Check if word fits on line
-                if curr_x + word_total_width > max_x:
-                    curr_x = start_x
-                    curr_y += self.line_height
-
-                # Draw the word
-                for item in word_items:
-                    img, width = item
-                    
-                    # Only paste if we actually have an image
-                    if img is not None:
-                        canvas.paste(img, (curr_x, curr_y), img)
-                    
-                    # ALWAYS move the cursor (creates the blank space if img is None)
-                    curr_x += width
+        # Resolve each distinct character to its glyph list once,
+        # instead of mapping + lowercasing it at every occurrence
+        char_glyphs = {
+            char: self._baked.get(SPECIAL_CHAR_MAP.get(char, char.lower()))
+            for char in set(line)
+        }
 
+        words = line.split(' ')
+        
+        for word in words:
+            # Consecutive spaces give empty words: no glyphs to look up,
+            # but they still wrap and add the gap like any other word
+            if not word:
+                if curr_x > max_x:
+                    curr_x = start_x
+                    curr_row += 1
                 curr_x += pixels_per_space
+                continue
+
+            # We store tuples: (AlphaMask, Width)
+            # If image is missing, we store (None, fallback_width)
+            word_items = [] 
+            word_total_width = 0
             
-            curr_x = start_x
-            curr_y += self.line_height
+            for char in word:
+                found_image = False
+                
+                glyphs = char_glyphs[char]
+                if glyphs:
+                    # SUCCESS: Add the letter image
+                    alpha = choice(glyphs)
+                    width = alpha.shape[1] + char_spacing
+                    word_items.append((alpha, width))
+                    word_total_width += width
+                    found_image = True
+                
+                # FAILURE: If folder missing, empty, or processing failed
+                if not found_image:
+                    # Add a BLANK placeholder
+                    # print(f"Missing: {char}") # Uncomment to debug
+                    word_items.append((None, fallback_width))
+                    word_total_width += fallback_width
+
+            # Check if word fits on line
+            if curr_x + word_total_width > max_x:
+                curr_x = start_x
+                curr_row += 1
+
+            placed_words.append((curr_row, curr_x, word_items))
+            curr_x += word_total_width
+
+            curr_x += pixels_per_space
+
+        # Single channel: a third of the memory of RGB, and letters never
+        # overlap so the baked glyphs are copied straight in - no per-word
+        # temporaries. Ink colour is applied once, when the block is
+        # blended onto the page.
+        block = np.zeros(((curr_row + 1) * line_height, 2480), dtype=np.uint8)
+        block_w = block.shape[1]
+        for row, x, word_items in placed_words:
+            y = row * line_height
+            for alpha, width in word_items:
+                # Only draw if we actually have an image
+                if alpha is not None:
+                    w = min(alpha.shape[1], block_w - x)
+                    if w > 0:
+                        block[y:y+std_size, x:x+w] = alpha[:, :w]
+                
+                # ALWAYS move the cursor (creates the blank space if alpha is None)
+                x += width
+        return block
+
+    def generate(self, text, output_file="normalized_notes.png", workers=1):
+        # workers: number of processes used to render paragraphs
+        # (1 = render everything in this process, None = one per CPU).
+        # With the glyphs preloaded a page renders in tens of milliseconds,
+        # so starting a process pool only pays off for very long texts.
+
+        # 1. Create the Canvas (plain NumPy array, wrapped as an Image at the end)
+        canvas = np.full((3508, 2480, 3), 255, dtype=np.uint8)
+
+        lines = text.split('\n')
+
+        # --- DRAWING LOOP ---
+        # Paragraphs always start on a fresh row, so each one can be
+        # rendered independently and stacked afterwards.
+        # Seeds come from the global RNG, so random.seed(...) before calling
+        # generate() makes the output reproducible for any worker count
+        seeds = [random.getrandbits(64) for _ in lines]
+        if workers == 1 or len(lines) < 2:
+            blocks = [self._render_paragraph(line, seed) for line, seed in zip(lines, seeds)]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,)) as pool:
+                blocks = list(pool.map(_render_paragraph_in_worker, lines, seeds))
+
+        curr_y = 200
+        for block in blocks:
+            if curr_y >= canvas.shape[0]:
+                break
+            self._composite(canvas, block, 0, curr_y)
+            curr_y += block.shape[0]
+
+        page = Image.fromarray(canvas)
 
         # --- SAVING LOGIC ---
         if output_file.endswith(".docx"):
-            temp_img_path = "temp_handwriting_render.png"
-            canvas.convert("RGB").save(temp_img_path)
+            # Encode in memory - no temp file. Low compression trades a
+            # slightly bigger .docx for a much faster encode.
+            img_buf = BytesIO()
+            page.save(img_buf, format="PNG", compress_level=1)
+            img_buf.seek(0)
             
             doc = Document()
             section = doc.sections[0]
@@ -212,22 +372,22 @@ class NormalizedHandwritingEngine:
             section.top_margin = Cm(1.27)
             section.bottom_margin = Cm(1.27)
             
-            doc.add_picture(temp_img_path, width=Inches(7.5))
+            doc.add_picture(img_buf, width=Inches(7.5))
             doc.save(output_file)
-            os.remove(temp_img_path)
             print(f"Created Word Document: {output_file}")
             
         else:
-            canvas.convert("RGB").save(output_file)
+            page.save(output_file)
             print(f"Created Image: {output_file}")
 # Usage
-engine = NormalizedHandwritingEngine(ink_color=(0, 20, 100))
-text = """I am applying for admission to the Master of Science in Robotics and Autonomous Systems at Khalifa University of Science and Technology, motivated by a strong interest in intelligent systems that integrate perception, data-driven decision-making, and real-world interaction. With an academic background in Computer Engineering and hands-on experience in machine learning, data analytics, and intelligent systems, I aim to develop advanced expertise in robotics and autonomy within a research-driven environment that supports the UAE’s vision for advanced technology and innovation.
+if __name__ == "__main__":
+    engine = NormalizedHandwritingEngine(ink_color=(0, 20, 100))
+    text = """I am applying for admission to the Master of Science in Robotics and Autonomous Systems at Khalifa University of Science and Technology, motivated by a strong interest in intelligent systems that integrate perception, data-driven decision-making, and real-world interaction. With an academic background in Computer Engineering and hands-on experience in machine learning, data analytics, and intelligent systems, I aim to develop advanced expertise in robotics and autonomy within a research-driven environment that supports the UAE’s vision for advanced technology and innovation.
 Throughout my undergraduate studies, I was particularly drawn to problems that bridged software intelligence with physical and cyber-physical systems. My coursework and projects exposed me to the challenges of designing systems that sense, reason, and act in dynamic environments. This interest extended beyond theoretical learning into practical projects involving machine learning pipelines, real-time data processing, IoT-based systems, and intelligent decision frameworks, which shaped my ambition to pursue graduate training in robotics and autonomous systems.
 I have worked on several projects that strengthened my foundation in data-driven intelligence, which I view as a critical component of modern autonomous systems. These include large-scale multilingual sentiment analysis, IoT-based data collection and analytics systems, and AI-driven control and decision-making architectures for smart environments. Through these projects, I gained experience in data preprocessing, feature extraction, model training, evaluation, and deployment under real-world constraints. These experiences highlighted the importance of robust perception, scalable computation, and reliable decision-making, all of which are central to autonomous robotic systems.
 In addition to data-centric work, I have explored applications at the intersection of computer vision, real-time inference, and intelligent control, reinforcing my understanding that effective robotics systems require more than isolated algorithms. Successful autonomy depends on the integration of sensing, learning, control, and system-level design, as well as careful evaluation under physical and operational constraints. I am particularly interested in how machine learning and data-driven methods can enhance robotic perception, motion planning, and adaptive decision-making in autonomous systems.
 The MSc in Robotics and Autonomous Systems curriculum at Khalifa University aligns strongly with my academic and professional goals. The program’s emphasis on robot perception, autonomous control, intelligent systems, and advanced AI techniques, combined with access to research facilities and interdisciplinary collaboration, makes it an ideal environment for my graduate studies. I am especially interested in engaging in research or thesis work related to autonomous robotics, intelligent sensing, and data-driven control, with applications in areas such as smart infrastructure, robotics for energy and sustainability, autonomous inspection, and intelligent urban systems.
 Through this program, I aim to develop a strong theoretical foundation and practical expertise in robotics and autonomy, while deepening my skills in machine learning, statistical modeling, and scalable computation as they apply to real-world robotic systems. I am particularly interested in topics such as sensor fusion, learning-based control, data-efficient learning, and interpretable autonomous decision-making, which are critical for deploying reliable and safe robotic systems.
 """
-text = text.lower()
-engine.generate(text,output_file="my_homework.docx")
\ No newline at end of file
+    text = text.lower()
+    engine.generate(text,output_file="my_homework.docx")
\ No newline at end of file